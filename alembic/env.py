@@ -10,14 +10,14 @@ import alembic.context as context
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 # Import settings after path modification
-from freight.core.config import settings  # noqa: E402
+from freight.core.config import get_settings  # noqa: E402
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
 
 # Set the database URL from our settings
-config.set_main_option("sqlalchemy.url", settings.database_url)
+config.set_main_option("sqlalchemy.url", get_settings().database_url)
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
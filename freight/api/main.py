@@ -1,19 +1,54 @@
 """Main FastAPI application."""
 
+from typing import Any, Callable, Dict
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+
+from freight.core.config import get_settings
+
+Scope = Dict[str, Any]
+
 
-from freight.core.config import settings
+class HealthFastPath:
+    """ASGI middleware that routes health probes around the middleware stack.
+
+    Health probes are the highest-QPS requests the app serves and never
+    carry an Origin header, so running them through CORS (header parsing,
+    origin matching, Vary mutation) is pure overhead. Requests under
+    /health are dispatched directly to a dedicated CORS-free sub-app.
+    """
+
+    def __init__(self, app: Callable[..., Any], health_app: Callable[..., Any]):
+        self.app = app
+        self.health_app = health_app
+
+    async def __call__(
+        self, scope: Scope, receive: Callable[..., Any], send: Callable[..., Any]
+    ) -> None:
+        if scope["type"] == "http" and scope["path"].startswith("/health"):
+            scope = {
+                **scope,
+                "path": scope["path"][len("/health") :] or "/",
+                "root_path": scope.get("root_path", "") + "/health",
+            }
+            await self.health_app(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
 
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
+    settings = get_settings()
     app = FastAPI(
         title=settings.app_name,
         version=settings.version,
         debug=settings.debug,
         docs_url="/docs" if settings.debug else None,
         redoc_url="/redoc" if settings.debug else None,
+        openapi_url="/openapi.json" if settings.debug else None,
+        default_response_class=ORJSONResponse,
     )
 
     # Add CORS middleware
@@ -25,10 +60,17 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
-    # Include routers
+    # Health probes live on a middleware-free sub-app, served ahead of CORS.
     from freight.api.routers import health
 
-    app.include_router(health.router, prefix="/health", tags=["health"])
+    health_app = FastAPI(
+        docs_url=None,
+        redoc_url=None,
+        openapi_url=None,
+        default_response_class=ORJSONResponse,
+    )
+    health_app.include_router(health.router, tags=["health"])
+    app.add_middleware(HealthFastPath, health_app=health_app)
 
     return app
 
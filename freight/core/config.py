@@ -1,5 +1,8 @@
 """Application configuration."""
 
+import os
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 from pydantic import Field
@@ -47,4 +50,49 @@ class Settings(BaseSettings):
     railway_token: Optional[str] = None
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the application settings, built once on first use."""
+    return Settings()
+
+
+@dataclass(frozen=True, slots=True)
+class HotSettings:
+    """Hot-path settings read straight from the environment.
+
+    Worker processes recycle every 1000 tasks (worker_max_tasks_per_child),
+    so each respawn re-pays the pydantic-settings validation cost of a full
+    Settings() build. This plain container reads os.environ directly and
+    skips validation; it does not read .env files, so worker deployments
+    must export their configuration (as the Docker images already do).
+    The API process keeps full validation via get_settings().
+    """
+
+    database_url: str
+    redis_url: str
+    celery_broker_url: str
+    celery_result_backend: str
+    version: str
+    environment: str
+
+    @classmethod
+    def from_env(cls) -> "HotSettings":
+        env = os.environ
+        return cls(
+            database_url=env.get("DATABASE_URL", ""),
+            redis_url=env.get("REDIS_URL", "redis://localhost:6379/0"),
+            celery_broker_url=env.get(
+                "CELERY_BROKER_URL", "redis://localhost:6379/0"
+            ),
+            celery_result_backend=env.get(
+                "CELERY_RESULT_BACKEND", "redis://localhost:6379/1"
+            ),
+            version=env.get("VERSION", "0.1.0"),
+            environment=env.get("ENVIRONMENT", "development"),
+        )
+
+
+@lru_cache(maxsize=1)
+def get_hot_settings() -> HotSettings:
+    """Return the hot-path settings, read once per process."""
+    return HotSettings.from_env()
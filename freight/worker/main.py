@@ -1,34 +1,73 @@
 """Celery worker application."""
 
+import msgspec
 from celery import Celery
+from kombu.serialization import register
 
-from freight.core.config import settings
-
-# Create Celery instance
-celery_app = Celery(
-    "freight",
-    broker=settings.celery_broker_url,
-    backend=settings.celery_result_backend,
-    include=["freight.worker.tasks"],
-)
-
-# Configure Celery
-celery_app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
-    timezone="UTC",
-    enable_utc=True,
-    worker_prefetch_multiplier=1,
-    task_acks_late=True,
-    task_reject_on_worker_lost=True,
-    worker_max_tasks_per_child=1000,
-    task_time_limit=3600,  # 1 hour
-    task_soft_time_limit=3000,  # 50 minutes
-)
-
-# Queue configuration
-celery_app.conf.task_routes = {
-    "freight.worker.tasks.process_migration_batch": {"queue": "default"},
-    "freight.worker.tasks.retry_failed_batch": {"queue": "high_priority"},
-}
+from freight.core.config import get_hot_settings
+
+
+def _register_msgspec() -> None:
+    """Register a msgspec-backed msgpack serializer with kombu.
+
+    msgspec encodes and decodes msgpack entirely in C, noticeably faster
+    than the msgpack-python bindings for the dict payloads our tasks
+    exchange. msgpack stays in accept_content so in-flight messages from
+    older producers still decode during a rolling deploy.
+    """
+    register(
+        "msgspec",
+        msgspec.msgpack.encode,
+        msgspec.msgpack.decode,
+        content_type="application/x-msgspec",
+        content_encoding="binary",
+    )
+
+
+def make_celery() -> Celery:
+    """Build and configure the Celery application."""
+    settings = get_hot_settings()
+    _register_msgspec()
+
+    celery_app = Celery(
+        "freight",
+        broker=settings.celery_broker_url,
+        backend=settings.celery_result_backend,
+        include=["freight.worker.tasks"],
+    )
+
+    celery_app.conf.update(
+        task_serializer="msgspec",
+        accept_content=["msgspec", "msgpack"],
+        result_serializer="msgspec",
+        timezone="UTC",
+        enable_utc=True,
+        broker_pool_limit=32,
+        broker_transport_options={
+            "socket_keepalive": True,
+            "health_check_interval": 30,
+        },
+        # Storing results costs a Redis round-trip per task; skip it by
+        # default and keep errors visible for debugging. Tasks whose
+        # results are consumed opt back in with ignore_result=False.
+        task_ignore_result=True,
+        task_store_errors_even_if_ignored=True,
+        result_expires=60,
+        worker_prefetch_multiplier=4,
+        task_acks_late=True,
+        task_reject_on_worker_lost=True,
+        worker_max_tasks_per_child=1000,
+        task_time_limit=3600,  # 1 hour
+        task_soft_time_limit=3000,  # 50 minutes
+    )
+
+    # Queue configuration
+    celery_app.conf.task_routes = {
+        "freight.worker.tasks.process_migration_batch": {"queue": "default"},
+        "freight.worker.tasks.retry_failed_batch": {"queue": "high_priority"},
+    }
+
+    return celery_app
+
+
+celery_app = make_celery()
@@ -1,38 +1,101 @@
 """Celery tasks for data migration processing."""
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
+import msgpack
+from redis import Redis
+
+from freight.core.config import get_hot_settings
 from freight.worker.main import celery_app
 
+# TTL for staged batch buffers; generous against queue backlog, short
+# enough that abandoned buffers don't accumulate.
+BATCH_BUFFER_TTL = 3600
+
+_redis_client: Optional[Redis] = None
+
+
+def _get_redis() -> Redis:
+    """Return the shared Redis client, connecting on first use."""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = Redis.from_url(get_hot_settings().redis_url)
+    return _redis_client
+
+
+def stage_batch(
+    tenant_id: str, job_id: str, batch_id: str, columns: Dict[str, List[Any]]
+) -> str:
+    """
+    Stage a columnar batch in Redis and return its buffer key.
+
+    The broker message then carries only the key instead of a multi-MB
+    encoded payload, so large batches never pass through the task queue.
+
+    Args:
+        tenant_id: The tenant identifier
+        job_id: The migration job identifier
+        batch_id: The batch identifier
+        columns: Mapping of field name to the list of values for that field
+
+    Returns:
+        The Redis key under which the batch buffer is stored
+    """
+    buffer_key = f"freight:batch:{tenant_id}:{job_id}:{batch_id}"
+    _get_redis().set(buffer_key, msgpack.packb(columns), ex=BATCH_BUFFER_TTL)
+    return buffer_key
+
 
-@celery_app.task(bind=True, name="freight.worker.tasks.process_migration_batch")  # type: ignore[misc]
+@celery_app.task(  # type: ignore[misc]
+    bind=True,
+    name="freight.worker.tasks.process_migration_batch",
+    ignore_result=True,
+)
 def process_migration_batch(
-    self: Any, tenant_id: str, job_id: str, batch_id: str, records: List[Dict[str, Any]]
+    self: Any, tenant_id: str, job_id: str, batch_id: str, buffer_key: str
 ) -> Dict[str, Any]:
     """
     Process a batch of records for migration.
 
+    Batches are staged out-of-band in Redis by stage_batch; the task
+    receives only the buffer key and fetches the columnar payload itself,
+    keeping broker messages small regardless of batch size.
+
     Args:
         tenant_id: The tenant identifier
         job_id: The migration job identifier
         batch_id: The batch identifier
-        records: List of records to process
+        buffer_key: Redis key of the staged columnar batch buffer
 
     Returns:
         Dictionary with processing results
     """
+    buffer = _get_redis().get(buffer_key)
+    if buffer is None:
+        raise ValueError(f"Batch buffer {buffer_key} not found or expired")
+    columns: Dict[str, List[Any]] = msgpack.unpackb(buffer)
+
+    lengths = {len(values) for values in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"Ragged batch {batch_id}: column lengths {sorted(lengths)}")
+    num_rows = lengths.pop() if lengths else 0
+
     # TODO: Implement actual migration logic
     return {
         "tenant_id": tenant_id,
         "job_id": job_id,
         "batch_id": batch_id,
-        "processed": len(records),
+        "processed": num_rows,
         "failed": 0,
         "errors": [],
     }
 
 
-@celery_app.task(bind=True, name="freight.worker.tasks.retry_failed_batch")  # type: ignore[misc]
+@celery_app.task(  # type: ignore[misc]
+    bind=True,
+    name="freight.worker.tasks.retry_failed_batch",
+    ignore_result=False,
+)
 def retry_failed_batch(
     self: Any, tenant_id: str, job_id: str, batch_id: str
 ) -> Dict[str, Any]:
@@ -57,7 +120,7 @@ def retry_failed_batch(
     }
 
 
-@celery_app.task(name="freight.worker.tasks.health_check")  # type: ignore[misc]
+@celery_app.task(name="freight.worker.tasks.health_check", ignore_result=True)  # type: ignore[misc]
 def health_check() -> Dict[str, str]:
     """Simple health check task for worker monitoring."""
     return {"status": "healthy", "worker": "operational"}
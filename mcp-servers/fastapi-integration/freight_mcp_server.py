@@ -4,12 +4,15 @@ Freight MCP Server
 Exposes Freight migration API endpoints as MCP tools for AI interaction.
 """
 
-from fastapi import FastAPI, HTTPException, Depends, Header
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 from fastapi_mcp import FastApiMCP
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from enum import Enum
+import orjson
+import time
 import uuid
 
 # Freight API Models
@@ -25,6 +28,8 @@ class LogStatus(str, Enum):
     RETRYING = "retrying"
 
 class CreateJobRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     source_config: Dict[str, Any] = Field(..., description="Source system configuration")
     target_config: Dict[str, Any] = Field(..., description="Target system configuration")
     batch_size: int = Field(default=1000, description="Number of records per batch")
@@ -32,6 +37,8 @@ class CreateJobRequest(BaseModel):
     started_by: str = Field(..., description="User or system that started the job")
 
 class MigrationJob(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     id: str = Field(..., description="Unique job identifier")
     tenant_id: str = Field(..., description="Tenant identifier")
     status: JobStatus = Field(..., description="Current job status")
@@ -42,6 +49,8 @@ class MigrationJob(BaseModel):
     updated_at: datetime = Field(..., description="Last update timestamp")
 
 class MigrationLog(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     id: str = Field(..., description="Unique log entry identifier")
     job_id: str = Field(..., description="Associated migration job ID")
     tenant_id: str = Field(..., description="Tenant identifier")
@@ -52,22 +61,155 @@ class MigrationLog(BaseModel):
     timestamp: datetime = Field(..., description="Log entry timestamp")
 
 class RetryRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     batch_ids: Optional[List[str]] = Field(None, description="Specific batch IDs to retry")
     max_retries: Optional[int] = Field(None, description="Override max retry attempts")
 
+# This server runs as a long-lived uvicorn process, so build the deferred
+# schemas once at startup rather than eating the lazy-build cost as a p99
+# spike on the first request to each endpoint.
+for _model in (CreateJobRequest, MigrationJob, MigrationLog, RetryRequest):
+    _model.model_rebuild()
+
+# Response Caching
+class ResponseCacheMiddleware:
+    """Cache idempotent GET responses in-process for a short TTL.
+
+    Dashboards poll the read endpoints far more often than job state
+    changes. Successful GET responses are keyed by path + query + tenant
+    and replayed for max_age seconds without running the handler; any
+    mutating request (POST/PUT/PATCH/DELETE) clears the cache. /health
+    is left uncached so its timestamp stays fresh.
+
+    Both the cache and its invalidation are per-process: under multiple
+    uvicorn workers, a write handled by one worker does not clear the
+    other workers' caches, so reads may serve job state up to max_age
+    stale after a write. If that window ever matters more than the saved
+    round-trips, this needs a shared backend (e.g. Redis) instead.
+
+    Expired entries are dropped when looked up, and inserts that would
+    exceed max_entries first sweep out expired entries, then evict the
+    oldest — every unique query string gets its own key, so without a cap
+    arbitrary clients could grow process memory without bound.
+    """
+
+    _MUTATING = ("POST", "PUT", "PATCH", "DELETE")
+
+    def __init__(self, app, max_age: float = 30.0, max_entries: int = 1024):
+        self.app = app
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self._cache: Dict[Any, Any] = {}
+
+    def _evict(self, now: float) -> None:
+        """Make room for one insert: sweep expired entries, then oldest-first."""
+        expired = [
+            key
+            for key, entry in self._cache.items()
+            if now - entry[0] >= self.max_age
+        ]
+        for key in expired:
+            del self._cache[key]
+        while len(self._cache) >= self.max_entries:
+            del self._cache[next(iter(self._cache))]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        if method in self._MUTATING:
+            self._cache.clear()
+            await self.app(scope, receive, send)
+            return
+        if method != "GET" or scope["path"] == "/health":
+            await self.app(scope, receive, send)
+            return
+
+        tenant = b""
+        for name, value in scope["headers"]:
+            if name == b"x-tenant-id":
+                tenant = value
+                break
+        key = (scope["path"], scope.get("query_string", b""), tenant)
+
+        now = time.monotonic()
+        cached = self._cache.get(key)
+        if cached is not None:
+            if now - cached[0] < self.max_age:
+                _, status, headers, body = cached
+                await send({
+                    "type": "http.response.start",
+                    "status": status,
+                    "headers": headers
+                })
+                await send({"type": "http.response.body", "body": body})
+                return
+            del self._cache[key]
+
+        messages = []
+
+        async def record(message):
+            messages.append(message)
+            await send(message)
+
+        await self.app(scope, receive, record)
+
+        start = next(
+            (m for m in messages if m["type"] == "http.response.start"), None
+        )
+        if start is not None and start["status"] == 200:
+            body = b"".join(
+                m.get("body", b"")
+                for m in messages
+                if m["type"] == "http.response.body"
+            )
+            if len(self._cache) >= self.max_entries:
+                self._evict(now)
+            self._cache[key] = (now, start["status"], start["headers"], body)
+
+# Tenant Authentication
+class TenantMiddleware:
+    """Resolve the tenant once per request and stash it on request.state.
+
+    The previous Header(...) dependency ran FastAPI's dependency resolver
+    (an await hop plus a cache lookup) for every tenant-scoped request.
+    A plain ASGI middleware reads the header straight from the scope;
+    handlers pick it up via request.state.tenant_id. Paths outside the
+    tenant-scoped API (health, docs, stats) are passed through untouched.
+    """
+
+    _TENANT_PREFIXES = ("/api/v1/jobs", "/api/v1/logs")
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith(self._TENANT_PREFIXES):
+            tenant_id = ""
+            for name, value in scope["headers"]:
+                if name == b"x-tenant-id":
+                    tenant_id = value.decode("latin-1")
+                    break
+            if not tenant_id:
+                response = ORJSONResponse(
+                    {"detail": "X-Tenant-ID header required"}, status_code=400
+                )
+                await response(scope, receive, send)
+                return
+            scope.setdefault("state", {})["tenant_id"] = tenant_id
+        await self.app(scope, receive, send)
+
 # FastAPI Application
 app = FastAPI(
     title="Freight Migration API",
     description="Multi-tenant data migration platform with retry mechanisms",
     version="1.0.0"
 )
-
-# Tenant Authentication Dependency
-async def get_tenant_id(x_tenant_id: str = Header(...)) -> str:
-    """Extract and validate tenant ID from headers."""
-    if not x_tenant_id:
-        raise HTTPException(status_code=400, detail="X-Tenant-ID header required")
-    return x_tenant_id
+app.add_middleware(ResponseCacheMiddleware, max_age=30.0)
+app.add_middleware(TenantMiddleware)
 
 # MCP Server Integration
 mcp = FastApiMCP(
@@ -79,10 +221,10 @@ mcp = FastApiMCP(
 
 # Migration Job Management Endpoints
 
-@app.post("/api/v1/jobs", response_model=MigrationJob, operation_id="create_migration_job")
+@app.post("/api/v1/jobs", response_model=None, operation_id="create_migration_job")
 async def create_job(
-    job_request: CreateJobRequest,
-    tenant_id: str = Depends(get_tenant_id)
+    request: Request,
+    job_request: CreateJobRequest
 ) -> MigrationJob:
     """
     Create a new migration job for the specified tenant.
@@ -90,8 +232,10 @@ async def create_job(
     This endpoint creates a new data migration job with the provided source and target
     configurations. The job will be queued for processing by Celery workers.
     """
+    tenant_id = request.state.tenant_id
     job_id = str(uuid.uuid4())
-    
+    now = datetime.utcnow()
+
     # Simulate job creation logic
     job = MigrationJob(
         id=job_id,
@@ -100,8 +244,8 @@ async def create_job(
         record_count=0,  # Will be updated by worker
         failed_batches=0,
         started_by=job_request.started_by,
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow()
+        created_at=now,
+        updated_at=now
     )
     
     # TODO: Queue job with Celery
@@ -109,13 +253,12 @@ async def create_job(
     
     return job
 
-@app.get("/api/v1/jobs", response_model=List[MigrationJob], operation_id="list_migration_jobs")
+@app.get("/api/v1/jobs", response_model=None, operation_id="list_migration_jobs")
 async def list_jobs(
     status: Optional[JobStatus] = None,
     limit: int = 100,
-    offset: int = 0,
-    tenant_id: str = Depends(get_tenant_id)
-) -> List[MigrationJob]:
+    offset: int = 0
+) -> ORJSONResponse:
     """
     List migration jobs for the tenant with optional filtering.
     
@@ -123,13 +266,12 @@ async def list_jobs(
     """
     # TODO: Implement database query
     # Simulate response for now
-    jobs = []
-    return jobs
+    jobs: List[MigrationJob] = []
+    return ORJSONResponse([job.model_dump(mode="json") for job in jobs])
 
-@app.get("/api/v1/jobs/{job_id}", response_model=MigrationJob, operation_id="get_migration_job")
+@app.get("/api/v1/jobs/{job_id}", response_model=None, operation_id="get_migration_job")
 async def get_job(
-    job_id: str,
-    tenant_id: str = Depends(get_tenant_id)
+    job_id: str
 ) -> MigrationJob:
     """
     Get detailed information about a specific migration job.
@@ -142,8 +284,7 @@ async def get_job(
 @app.post("/api/v1/jobs/{job_id}/retry", operation_id="retry_migration_job")
 async def retry_job(
     job_id: str,
-    retry_request: RetryRequest,
-    tenant_id: str = Depends(get_tenant_id)
+    retry_request: RetryRequest
 ) -> Dict[str, Any]:
     """
     Retry failed batches for a migration job.
@@ -162,8 +303,7 @@ async def retry_job(
 
 @app.delete("/api/v1/jobs/{job_id}", operation_id="cancel_migration_job")
 async def cancel_job(
-    job_id: str,
-    tenant_id: str = Depends(get_tenant_id)
+    job_id: str
 ) -> Dict[str, str]:
     """
     Cancel a running migration job.
@@ -177,28 +317,26 @@ async def cancel_job(
 
 # Migration Logs and Audit Trail
 
-@app.get("/api/v1/jobs/{job_id}/logs", response_model=List[MigrationLog], operation_id="get_migration_logs")
+@app.get("/api/v1/jobs/{job_id}/logs", response_model=None, operation_id="get_migration_logs")
 async def get_job_logs(
     job_id: str,
     status: Optional[LogStatus] = None,
     limit: int = 1000,
-    offset: int = 0,
-    tenant_id: str = Depends(get_tenant_id)
-) -> List[MigrationLog]:
+    offset: int = 0
+) -> ORJSONResponse:
     """
     Get detailed logs for a migration job.
     
     Returns record-level processing logs with error details and retry information.
     """
     # TODO: Implement database query with tenant isolation
-    logs = []
-    return logs
+    logs: List[MigrationLog] = []
+    return ORJSONResponse([log.model_dump(mode="json") for log in logs])
 
 @app.get("/api/v1/logs/export/{job_id}", operation_id="export_migration_logs")
 async def export_logs(
     job_id: str,
-    format: str = "csv",
-    tenant_id: str = Depends(get_tenant_id)
+    format: str = "csv"
 ) -> Dict[str, str]:
     """
     Export migration logs to downloadable format.
@@ -213,30 +351,46 @@ async def export_logs(
 
 # Statistics and Reporting
 
+# The stats/monitoring stubs return constant payloads until the real
+# implementations land, so their JSON is encoded once at import and each
+# handler collapses to a single ASGI send.
+_JOB_STATS_BYTES = orjson.dumps({
+    "total_jobs": 0,
+    "by_status": {
+        "pending": 0,
+        "running": 0,
+        "completed": 0,
+        "failed": 0
+    },
+    "success_rate": 0.0,
+    "avg_duration_minutes": 0.0
+})
+_TENANT_STATS_BYTES = orjson.dumps({
+    "total_tenants": 0,
+    "active_jobs": 0,
+    "total_records_processed": 0,
+    "platform_success_rate": 0.0
+})
+_WORKER_STATUS_BYTES = orjson.dumps({
+    "active_workers": 0,
+    "queue_length": 0,
+    "processing_rate": 0.0
+})
+_HEALTH_PREFIX = b'{"status":"healthy","timestamp":"'
+_HEALTH_SUFFIX = b'"}'
+
 @app.get("/api/v1/stats/jobs", operation_id="get_job_statistics")
-async def get_job_stats(
-    tenant_id: str = Depends(get_tenant_id)
-) -> Dict[str, Any]:
+async def get_job_stats() -> Response:
     """
     Get aggregated statistics for migration jobs.
     
     Returns job counts by status, success rates, and performance metrics.
     """
-    # TODO: Implement statistics calculation
-    return {
-        "total_jobs": 0,
-        "by_status": {
-            "pending": 0,
-            "running": 0,
-            "completed": 0,
-            "failed": 0
-        },
-        "success_rate": 0.0,
-        "avg_duration_minutes": 0.0
-    }
+    # TODO: Implement statistics calculation (tenant-scoped)
+    return Response(content=_JOB_STATS_BYTES, media_type="application/json")
 
 @app.get("/api/v1/stats/tenants", operation_id="get_tenant_statistics")
-async def get_tenant_stats() -> Dict[str, Any]:
+async def get_tenant_stats() -> Response:
     """
     Get platform-wide tenant statistics (admin only).
     
@@ -244,36 +398,41 @@ async def get_tenant_stats() -> Dict[str, Any]:
     """
     # TODO: Implement admin authorization check
     # TODO: Calculate cross-tenant statistics
-    return {
-        "total_tenants": 0,
-        "active_jobs": 0,
-        "total_records_processed": 0,
-        "platform_success_rate": 0.0
-    }
+    return Response(content=_TENANT_STATS_BYTES, media_type="application/json")
 
 # Health and Monitoring
 
 @app.get("/health", operation_id="health_check")
-async def health_check() -> Dict[str, str]:
+async def health_check() -> Response:
     """
     Health check endpoint for monitoring and load balancers.
     """
-    return {"status": "healthy", "timestamp": datetime.utcnow().isoformat()}
+    timestamp = datetime.utcnow().isoformat().encode()
+    return Response(
+        content=_HEALTH_PREFIX + timestamp + _HEALTH_SUFFIX,
+        media_type="application/json"
+    )
 
 @app.get("/api/v1/workers/status", operation_id="get_worker_status")
-async def get_worker_status() -> Dict[str, Any]:
+async def get_worker_status() -> Response:
     """
     Get status of Celery workers and job queues.
     
     Returns worker health, queue lengths, and processing statistics.
     """
     # TODO: Implement Celery worker inspection
-    return {
-        "active_workers": 0,
-        "queue_length": 0,
-        "processing_rate": 0.0
-    }
+    return Response(content=_WORKER_STATUS_BYTES, media_type="application/json")
 
 if __name__ == "__main__":
+    import os
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # uvloop/httptools replace the pure-Python event loop and HTTP parser
+    # with C implementations; multiple workers need an app import string.
+    uvicorn.run(
+        "freight_mcp_server:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=os.cpu_count()
+    )
\ No newline at end of file
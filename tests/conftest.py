@@ -1,12 +1,31 @@
 """Test configuration and fixtures."""
 
+from typing import AsyncIterator
+
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
 from freight.api.main import app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client() -> TestClient:  # type: ignore[misc]
-    """Create a test client for the FastAPI application."""
+    """Create a test client for the FastAPI application, shared per session.
+
+    Kept for legacy tests; prefer the aclient fixture, which skips the
+    TestClient thread portal.
+    """
     return TestClient(app)
+
+
+@pytest.fixture
+async def aclient() -> AsyncIterator[httpx.AsyncClient]:
+    """Create an async in-process client for the FastAPI application.
+
+    Talks to the app through ASGITransport directly, avoiding the
+    thread hop and sync portal that TestClient adds to every request.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
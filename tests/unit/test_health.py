@@ -1,11 +1,11 @@
 """Tests for health check endpoints."""
 
-from fastapi.testclient import TestClient
+import httpx
 
 
-def test_health_check(client: TestClient) -> None:
+async def test_health_check(aclient: httpx.AsyncClient) -> None:
     """Test basic health check endpoint."""
-    response = client.get("/health/")
+    response = await aclient.get("/health/")
     assert response.status_code == 200
 
     data = response.json()
@@ -15,9 +15,9 @@ def test_health_check(client: TestClient) -> None:
     assert "environment" in data
 
 
-def test_readiness_check(client: TestClient) -> None:
+async def test_readiness_check(aclient: httpx.AsyncClient) -> None:
     """Test readiness check endpoint."""
-    response = client.get("/health/ready")
+    response = await aclient.get("/health/ready")
     assert response.status_code == 200
 
     data = response.json()
@@ -26,9 +26,9 @@ def test_readiness_check(client: TestClient) -> None:
     assert "checks" in data
 
 
-def test_liveness_check(client: TestClient) -> None:
+async def test_liveness_check(aclient: httpx.AsyncClient) -> None:
     """Test liveness check endpoint."""
-    response = client.get("/health/live")
+    response = await aclient.get("/health/live")
     assert response.status_code == 200
 
     data = response.json()
@@ -1,9 +1,16 @@
 """Tests for Celery worker tasks."""
 
-from typing import Any
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
-from freight.worker.tasks import health_check, process_migration_batch
+import msgpack
+import pytest
+
+from freight.worker.tasks import (
+    BATCH_BUFFER_TTL,
+    health_check,
+    process_migration_batch,
+    stage_batch,
+)
 
 
 def test_health_check_task() -> None:
@@ -13,18 +20,27 @@ def test_health_check_task() -> None:
     assert result["worker"] == "operational"
 
 
-@patch("freight.worker.tasks.process_migration_batch.apply_async")
-def test_process_migration_batch_task(mock_apply_async: Any) -> None:
+def test_process_migration_batch_task() -> None:
     """Test the process migration batch task."""
-    # Test the actual task function
+    # Test the actual task function with a staged batch buffer
     tenant_id = "tenant-123"
     job_id = "job-456"
     batch_id = "batch-789"
-    records = [{"id": 1, "name": "test"}, {"id": 2, "name": "test2"}]
+    buffer_key = f"freight:batch:{tenant_id}:{job_id}:{batch_id}"
+    columns = {"id": [1, 2], "name": ["test", "test2"]}
 
-    result = process_migration_batch(
-        tenant_id=tenant_id, job_id=job_id, batch_id=batch_id, records=records
-    )
+    fake_redis = MagicMock()
+    fake_redis.get.return_value = msgpack.packb(columns)
+
+    with patch("freight.worker.tasks._get_redis", return_value=fake_redis):
+        result = process_migration_batch(
+            tenant_id=tenant_id,
+            job_id=job_id,
+            batch_id=batch_id,
+            buffer_key=buffer_key,
+        )
+
+    fake_redis.get.assert_called_once_with(buffer_key)
 
     assert result["tenant_id"] == tenant_id
     assert result["job_id"] == job_id
@@ -32,3 +48,53 @@ def test_process_migration_batch_task(mock_apply_async: Any) -> None:
     assert result["processed"] == 2
     assert result["failed"] == 0
     assert result["errors"] == []
+
+
+def test_stage_batch_stores_buffer_with_ttl() -> None:
+    """Test that stage_batch writes the packed columns under the expected key."""
+    columns = {"id": [1, 2], "name": ["test", "test2"]}
+
+    fake_redis = MagicMock()
+
+    with patch("freight.worker.tasks._get_redis", return_value=fake_redis):
+        buffer_key = stage_batch(
+            tenant_id="tenant-123",
+            job_id="job-456",
+            batch_id="batch-789",
+            columns=columns,
+        )
+
+    assert buffer_key == "freight:batch:tenant-123:job-456:batch-789"
+    fake_redis.set.assert_called_once_with(
+        buffer_key, msgpack.packb(columns), ex=BATCH_BUFFER_TTL
+    )
+
+
+def test_process_migration_batch_missing_buffer() -> None:
+    """Test that a missing or expired batch buffer fails the task."""
+    fake_redis = MagicMock()
+    fake_redis.get.return_value = None
+
+    with patch("freight.worker.tasks._get_redis", return_value=fake_redis):
+        with pytest.raises(ValueError, match="not found or expired"):
+            process_migration_batch(
+                tenant_id="tenant-123",
+                job_id="job-456",
+                batch_id="batch-789",
+                buffer_key="freight:batch:tenant-123:job-456:batch-789",
+            )
+
+
+def test_process_migration_batch_ragged_columns() -> None:
+    """Test that columns of unequal length are rejected."""
+    fake_redis = MagicMock()
+    fake_redis.get.return_value = msgpack.packb({"id": [1, 2], "name": ["test"]})
+
+    with patch("freight.worker.tasks._get_redis", return_value=fake_redis):
+        with pytest.raises(ValueError, match="Ragged batch batch-789"):
+            process_migration_batch(
+                tenant_id="tenant-123",
+                job_id="job-456",
+                batch_id="batch-789",
+                buffer_key="freight:batch:tenant-123:job-456:batch-789",
+            )